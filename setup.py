@@ -7,12 +7,16 @@ setup(
     install_requires=[
         'pandas>=2.0.0',
         'pyarrow>=14.0.1',
+        'orjson>=3.9.0',
         'tqdm>=4.65.0',
         'python-dotenv>=1.0.0',
         'emoji>=2.8.0',
         'unicodedata2>=15.1.0',
     ],
     extras_require={
+        'media': [
+            'blake3>=0.4.0',
+        ],
         'dev': [
             'pytest>=7.4.0',
             'black>=23.9.1',
@@ -6,6 +6,8 @@ import pandas as pd
 from datetime import datetime
 import pytz
 import logging
+import pyarrow.parquet as pq
+from twitter_analysis.preprocessing import archive_processor
 from twitter_analysis.preprocessing.archive_processor import TwitterArchivePreprocessor, Tweet, TweetMedia
 
 @pytest.fixture
@@ -93,6 +95,40 @@ def test_load_json_file(preprocessor, temp_archive):
     assert "tweet" in data[0]
     assert data[0]["tweet"]["id_str"] == "123456789"
 
+def test_load_json_file_js_wrapper(preprocessor, tmp_path, sample_tweets_js):
+    """Test that the window.YTD JavaScript wrapper is stripped before parsing"""
+    js_file = tmp_path / "wrapped.js"
+    js_file.write_text("window.YTD.tweets.part0 = " + json.dumps(sample_tweets_js), encoding="utf-8")
+    data = preprocessor.load_json_file(js_file)
+    
+    assert len(data) == 2
+    assert data[1]["tweet"]["full_text"].endswith("📸")
+
+@pytest.mark.parametrize("date_str", [
+    "Wed Oct 10 20:19:24 +0000 2018",
+    "Sun Jan 01 00:00:00 +0000 2012",
+    "Mon Dec 31 23:59:59 +0530 2018",
+    "Tue Mar 05 09:07:03 -0800 2019",
+])
+def test_parse_datetime(preprocessor, date_str):
+    """Test the fast timestamp parser against strptime"""
+    assert preprocessor.parse_datetime(date_str) == datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y')
+    assert preprocessor.parse_datetime(date_str).utcoffset() == datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y').utcoffset()
+
+def test_parse_datetime_invalid(preprocessor):
+    """Test that malformed timestamps raise ValueError"""
+    for date_str in ["not a date", "Wed Foo 10 20:19:24 +0000 2018", "Wed Oct 1x 20:19:24 +0000 2018",
+                     "XXXXOct 10 20:19:24 +0000 2018", "Wed Oct 10T20x19x24 Z0000 2018"]:
+        with pytest.raises(ValueError):
+            preprocessor.parse_datetime(date_str)
+
+def test_clean_text(preprocessor):
+    """Test HTML entity decoding and whitespace normalization"""
+    assert preprocessor.clean_text("a &amp; b  &lt;3\n&gt;") == "a & b <3 >"
+    # Entities are decoded once, not recursively
+    assert preprocessor.clean_text("&amp;lt;") == "&lt;"
+    assert preprocessor.clean_text("  plain   text ") == "plain text"
+
 def test_process_tweet(preprocessor):
     """Test processing of individual tweets"""
     sample_tweet_data = {
@@ -122,6 +158,19 @@ def test_process_tweet(preprocessor):
     assert tweet.hashtags == ["test"]
     assert not tweet.is_retweet
 
+def test_extract_tweet_interns_strings(sample_tweets_js):
+    """Test that repeated low-cardinality strings share one object across a file's tweets"""
+    first, second = json.loads(json.dumps(sample_tweets_js))
+    second['tweet']['entities']['hashtags'] = [{"text": "".join(["te", "st"])}]
+    
+    interned = {}
+    row_a = archive_processor._extract_tweet(first, interned)
+    row_b = archive_processor._extract_tweet(second, interned)
+    lang = archive_processor.TWEET_SCHEMA.names.index('lang')
+    hashtags = archive_processor.TWEET_SCHEMA.names.index('hashtags')
+    assert row_a[lang] is row_b[lang]
+    assert row_a[hashtags][0] is row_b[hashtags][0]
+
 def test_process_archive(preprocessor):
     """Test processing of the entire archive"""
     df = preprocessor.process_archive()
@@ -138,6 +187,51 @@ def test_process_archive(preprocessor):
     assert pd.api.types.is_datetime64_any_dtype(df['created_at'])
     assert pd.api.types.is_integer_dtype(df['likes'])
     assert pd.api.types.is_integer_dtype(df['retweets'])
+    assert isinstance(df['lang'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['day_of_week'].dtype, pd.CategoricalDtype)
+    assert df['day_of_week'].cat.ordered
+    assert df['day_of_week'].cat.categories[0] == 'Monday'
+    assert df['hour_of_day'].dtype == 'int8'
+    assert pd.api.types.is_bool_dtype(df['has_media'])
+    assert pd.api.types.is_bool_dtype(df['is_retweet'])
+    assert df['is_retweet'].tolist() == [False, True]
+    assert df['has_media'].tolist() == [False, True]
+
+def test_tweets_to_table(preprocessor, sample_tweets_js):
+    """Test Arrow table construction and derived features"""
+    tweets = [preprocessor.process_tweet(t) for t in sample_tweets_js]
+    table = preprocessor.tweets_to_table(tweets)
+    
+    assert table.num_rows == 2
+    assert table['has_media'].to_pylist() == [False, True]
+    assert table['tweet_length'].to_pylist() == [len(t.text) for t in tweets]
+    assert table['hour_of_day'].to_pylist() == [20, 10]
+    assert table['day_of_week'].to_pylist() == ['Wednesday', 'Thursday']
+    assert table['media'].to_pylist()[1][0]['type'] == 'photo'
+
+def test_tweets_to_table_raw_dates(preprocessor, sample_tweets_js, caplog):
+    """Test bulk parsing of raw date strings, dropping unparseable ones"""
+    tweets = [preprocessor.process_tweet(t) for t in sample_tweets_js]
+    tweets[0].created_at = "Wed Oct 10 20:19:24 +0000 2018"
+    tweets[1].created_at = "not a date"
+    with caplog.at_level(logging.WARNING):
+        table = preprocessor.tweets_to_table(tweets)
+    
+    assert table['id'].to_pylist() == ["123456789"]
+    assert table['hour_of_day'].to_pylist() == [20]
+    assert "Dropping 1 tweets with unparseable dates, e.g. ['987654321']" in caplog.text
+
+def test_debug_structure_logging(preprocessor, caplog):
+    """Test that tweet structure dumps are only produced when debug logging is on"""
+    with caplog.at_level(logging.INFO, logger=archive_processor.__name__):
+        preprocessor.process_archive()
+    assert "First tweet structure" not in caplog.text
+    
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG, logger=archive_processor.__name__):
+        preprocessor.process_archive()
+    assert "First tweet structure" in caplog.text
+    assert "First processed tweet structure" in caplog.text
 
 def test_save_formats(preprocessor):
     """Test that files are saved in specified formats"""
@@ -154,6 +248,96 @@ def test_save_formats(preprocessor):
     assert len(df_parquet) == len(df)
     assert len(df_csv) == len(df)
 
+def test_parquet_streamed_in_batches(preprocessor, monkeypatch):
+    """Test that Parquet is written one row group per batch and the DataFrame stays sorted"""
+    monkeypatch.setattr(archive_processor, 'PARQUET_BATCH_SIZE', 1)
+    df = preprocessor.process_archive()
+    
+    parquet_file = pq.ParquetFile(preprocessor.output_path / 'tweets_processed.parquet')
+    assert parquet_file.metadata.num_row_groups == 2
+    assert parquet_file.metadata.num_rows == 2
+    assert df['created_at'].is_monotonic_increasing
+
+def test_parquet_sorted_across_files(preprocessor, temp_archive, sample_tweets_js, monkeypatch):
+    """Test that the Parquet file is sorted by timestamp across data files, cached or not"""
+    monkeypatch.setattr(archive_processor, 'PARQUET_BATCH_SIZE', 1)
+    # The first data file holds the later tweet
+    (temp_archive / "data" / "tweets-part1.js").write_text(json.dumps(sample_tweets_js[1:]))
+    (temp_archive / "data" / "tweets.js").write_text(json.dumps(sample_tweets_js[:1]))
+    
+    for _ in range(2):  # the second run reads from the cache
+        df = preprocessor.process_archive()
+        df_parquet = pd.read_parquet(preprocessor.output_path / 'tweets_processed.parquet')
+        assert df_parquet['id'].tolist() == ["123456789", "987654321"]
+        assert df['id'].tolist() == df_parquet['id'].tolist()
+
+def test_failed_parquet_write_keeps_previous_output(preprocessor, temp_archive, sample_tweets_js, monkeypatch):
+    """Test that a failed Parquet write leaves the previous file in place"""
+    preprocessor.process_archive()
+    
+    def failing_write_table(table, where, **kwargs):
+        Path(where).write_bytes(b"partial")
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(archive_processor.pq, 'write_table', failing_write_table)
+    (temp_archive / "data" / "tweets.js").write_text(json.dumps(sample_tweets_js[:1]))
+    preprocessor.process_archive()
+    
+    assert len(pd.read_parquet(preprocessor.output_path / 'tweets_processed.parquet')) == 2
+    assert not (preprocessor.output_path / 'tweets_processed.parquet.tmp').exists()
+
+def test_extract_file_cache(preprocessor, temp_archive, sample_tweets_js):
+    """Test that extracted rows are cached per file and invalidated when the file changes"""
+    df = preprocessor.process_archive()
+    cache_files = list(preprocessor.cache_path.glob('tweets_*.parquet'))
+    assert len(cache_files) == 1
+    
+    # A second run reads the cache and produces the same tweets
+    df_cached = preprocessor.process_archive()
+    assert df_cached['id'].tolist() == df['id'].tolist()
+    assert df_cached['media'].map(len).tolist() == df['media'].map(len).tolist()
+    
+    # Changing the file replaces its cache entry
+    (temp_archive / "data" / "tweets.js").write_text(json.dumps(sample_tweets_js[:1]))
+    assert len(preprocessor.process_archive()) == 1
+    new_cache_files = list(preprocessor.cache_path.glob('tweets_*.parquet'))
+    assert len(new_cache_files) == 1
+    assert new_cache_files != cache_files
+
+def test_unreadable_file_not_cached(preprocessor, temp_archive):
+    """Test that a file that fails to parse is retried next run instead of cached as empty"""
+    (temp_archive / "data" / "broken.js").write_text("invalid json content")
+    df = preprocessor.process_archive()
+    
+    assert len(df) == 2
+    assert not list(preprocessor.cache_path.glob('broken_*.parquet'))
+    assert len(list(preprocessor.cache_path.glob('tweets_*.parquet'))) == 1
+
+def test_default_save_formats(temp_archive, tmp_path):
+    """Test that only Parquet is written unless other formats are requested"""
+    output_dir = tmp_path / "default_output"
+    preprocessor = TwitterArchivePreprocessor(archive_path=str(temp_archive), output_path=str(output_dir))
+    preprocessor.process_archive()
+    
+    assert (output_dir / 'tweets_processed.parquet').exists()
+    assert not (output_dir / 'tweets_processed.csv').exists()
+
+def test_feather_format(temp_archive, tmp_path):
+    """Test that Feather output round-trips the processed DataFrame"""
+    output_dir = tmp_path / "feather_output"
+    preprocessor = TwitterArchivePreprocessor(
+        archive_path=str(temp_archive),
+        output_path=str(output_dir),
+        save_formats=['feather']
+    )
+    df = preprocessor.process_archive()
+    
+    df_feather = pd.read_feather(output_dir / 'tweets_processed.feather')
+    assert df_feather['id'].tolist() == df['id'].tolist()
+    assert df_feather['media'].map(len).tolist() == df['media'].map(len).tolist()
+    assert not (output_dir / 'tweets_processed.parquet').exists()
+    assert not (output_dir / 'tweets_processed.parquet.tmp').exists()
+
 def test_error_handling(preprocessor, tmp_path):
     """Test error handling for invalid files and data"""
     # Test with invalid JSON file
@@ -190,6 +374,20 @@ def test_media_handling(preprocessor):
     assert isinstance(tweet.media[0], TweetMedia)
     assert tweet.media[0].type == "photo"
 
+def test_find_local_media(temp_archive, tmp_path):
+    """Test resolving media URLs against the assets directories"""
+    media_dir = temp_archive / "assets" / "media"
+    media_dir.mkdir()
+    (media_dir / "sample.jpg").write_bytes(b"")
+    (temp_archive / "assets" / "both.jpg").write_bytes(b"")
+    (media_dir / "both.jpg").write_bytes(b"")
+    preprocessor = TwitterArchivePreprocessor(archive_path=str(temp_archive), output_path=str(tmp_path / "output"))
+    
+    assert preprocessor.find_local_media("http://pbs.twimg.com/media/sample.jpg") == str(media_dir / "sample.jpg")
+    assert preprocessor.find_local_media("http://pbs.twimg.com/media/both.jpg") == str(temp_archive / "assets" / "both.jpg")
+    assert preprocessor.find_local_media("http://pbs.twimg.com/media/missing.jpg") is None
+    assert preprocessor.find_local_media("") is None
+
 def test_summary_stats(preprocessor):
     """Test generation of summary statistics"""
     df = preprocessor.process_archive()
@@ -204,4 +402,38 @@ def test_summary_stats(preprocessor):
     # Check specific stats
     assert stats['total_tweets'] == 2
     assert isinstance(stats['engagement']['total_likes'], (int, float))
-    assert isinstance(stats['content_analysis']['avg_tweet_length'], float)
\ No newline at end of file
+    assert isinstance(stats['content_analysis']['avg_tweet_length'], float)
+
+def test_summary_stats_top_hashtags_break_ties(preprocessor, temp_archive, sample_tweets_js):
+    """Test that the top hashtags are cut at 10, with tied counts ordered by hashtag"""
+    first, second = sample_tweets_js
+    first["tweet"]["entities"]["hashtags"] = [{"text": tag} for tag in ["popular", *"lkjihgfedcba"]]
+    second["tweet"]["entities"]["hashtags"] = [{"text": "popular"}]
+    (temp_archive / "data" / "tweets.js").write_text(json.dumps([first, second]))
+    
+    stats = preprocessor.generate_summary_stats(preprocessor.process_archive())
+    expected = {"popular": 2, **{tag: 1 for tag in "abcdefghi"}}
+    assert list(stats['content_analysis']['most_common_hashtags'].items()) == list(expected.items())
+
+def test_summary_stats_empty_archive(tmp_path):
+    """Test that an archive without tweets summarizes to zero totals"""
+    archive_dir = tmp_path / "empty_archive"
+    (archive_dir / "data").mkdir(parents=True)
+    (archive_dir / "data" / "tweets.js").write_text("[]")
+    preprocessor = TwitterArchivePreprocessor(archive_path=str(archive_dir), output_path=str(tmp_path / "output"))
+    
+    stats = preprocessor.generate_summary_stats(preprocessor.process_archive())
+    assert stats['total_tweets'] == 0
+    assert stats['content_analysis']['tweets_with_urls'] == 0
+    assert stats['content_analysis']['most_common_hashtags'] == {}
+
+def test_summary_stats_from_parquet(preprocessor):
+    """Test that summary statistics can be computed from the saved Parquet file"""
+    df = preprocessor.process_archive()
+    stats = preprocessor.generate_summary_stats()
+    
+    assert stats['total_tweets'] == len(df)
+    assert stats['engagement']['total_likes'] == 5
+    assert stats['content_analysis']['tweets_with_media'] == 1
+    assert stats['content_analysis']['most_common_hashtags'] == {'test': 1}
+    assert stats['timing']['most_active_hours'] == {20: 1, 10: 1}
@@ -0,0 +1,71 @@
+# tests/preprocessing/test_media_handler.py
+import pytest
+import json
+import logging
+from twitter_analysis.preprocessing.media_handler import MediaHandler
+
+@pytest.fixture
+def temp_media_archive(tmp_path):
+    """Create a temporary archive with a few media files, two of them identical"""
+    media_dir = tmp_path / "twitter_archive" / "data" / "media"
+    media_dir.mkdir(parents=True)
+    (media_dir / "111-abc.jpg").write_bytes(b"same bytes")
+    (media_dir / "222-def.jpg").write_bytes(b"same bytes")
+    (media_dir / "333-ghi.png").write_bytes(b"different")
+    return tmp_path / "twitter_archive"
+
+@pytest.fixture
+def handler(temp_media_archive, tmp_path):
+    return MediaHandler(archive_path=str(temp_media_archive), output_path=str(tmp_path / "output"))
+
+def test_calculate_file_hash(handler, temp_media_archive):
+    """Test that identical content yields identical fingerprints"""
+    media_dir = temp_media_archive / "data" / "media"
+    same_a = handler.calculate_file_hash(media_dir / "111-abc.jpg")
+    same_b = handler.calculate_file_hash(media_dir / "222-def.jpg")
+    other = handler.calculate_file_hash(media_dir / "333-ghi.png")
+    
+    assert same_a == same_b
+    assert same_a != other
+
+def test_organize_media(handler):
+    """Test mapping tweet IDs to media file IDs"""
+    tweet_media_map = handler.organize_media()
+    
+    assert tweet_media_map["111"] == ["111-abc"]
+    assert set(tweet_media_map) == {"111", "222", "333"}
+    assert handler.inventory_path.exists()
+
+def test_only_same_size_files_are_hashed(handler):
+    """Test that files with a unique size skip hashing but duplicates are still found"""
+    handler.organize_media()
+    
+    assert handler.media_inventory["333-ghi"].hash_fingerprint is None
+    assert handler.media_inventory["111-abc"].hash_fingerprint == handler.media_inventory["222-def"].hash_fingerprint
+    
+    handler.generate_media_report()
+    report = json.loads((handler.output_path / "media_report.json").read_text())
+    assert len(report["duplicate_files"]) == 1
+
+def test_inventory_skips_unchanged_files(handler, temp_media_archive, tmp_path, caplog):
+    """Test that a second run reuses fingerprints for unchanged files"""
+    handler.organize_media()
+    fingerprints = {k: m.hash_fingerprint for k, m in handler.media_inventory.items()}
+    
+    rerun = MediaHandler(archive_path=str(temp_media_archive), output_path=str(tmp_path / "output"))
+    with caplog.at_level(logging.INFO):
+        rerun.organize_media()
+    
+    assert "reusing 2 cached fingerprints, hashing 0" in caplog.text
+    assert {k: m.hash_fingerprint for k, m in rerun.media_inventory.items()} == fingerprints
+
+def test_empty_inventory_round_trips(tmp_path, caplog):
+    """Test that an archive without media saves an inventory the next run can read"""
+    archive_dir = tmp_path / "empty_archive"
+    archive_dir.mkdir()
+    for _ in range(2):
+        handler = MediaHandler(archive_path=str(archive_dir), output_path=str(tmp_path / "output"))
+        with caplog.at_level(logging.WARNING):
+            assert handler.organize_media() == {}
+    
+    assert "Ignoring unreadable media inventory" not in caplog.text
@@ -1,5 +1,6 @@
 # tests/preprocessing/test_text_cleaner.py
 import pytest
+import pandas as pd
 from twitter_analysis.preprocessing.text_cleaner import TextCleaner
 
 def test_basic_text_cleaning():
@@ -11,6 +12,13 @@ def test_basic_text_cleaning():
     assert "Hello & world!" in cleaned
     assert "https://example.com" not in cleaned  # URLs removed by default
     
+def test_html_entities():
+    cleaner = TextCleaner()
+    text = "Fish &amp; chips &lt;3 &quot;yum&quot; it&#39;s &gt; pizza"
+    
+    cleaned = cleaner.clean_text(text, remove_numbers=False)
+    assert cleaned == "Fish & chips <3 \"yum\" it's > pizza"
+    
 def test_emoji_preservation():
     cleaner = TextCleaner()
     text = "Hello 👋 World! 🌍"
@@ -29,4 +37,41 @@ def test_hashtag_handling():
     
     # Test with hashtags removed
     cleaned = cleaner.clean_text(text, remove_hashtags=True)
-    assert "#MachineLearning" not in cleaned
\ No newline at end of file
+    assert "#MachineLearning" not in cleaned
+
+def test_combined_removals():
+    cleaner = TextCleaner()
+    text = "@alice see https://t.co/abc or mail me@example.com about #AI in 2024"
+    
+    cleaned = cleaner.clean_text(text, remove_mentions=True, remove_hashtags=True,
+                                 remove_numbers=True)
+    assert cleaned == "see or mail about in"
+    
+    # Nothing enabled leaves the text untouched apart from whitespace
+    cleaned = cleaner.clean_text(text, remove_urls=False, remove_emails=False)
+    assert cleaned == text
+
+def test_email_pattern_takes_leftmost_match():
+    cleaner = TextCleaner()
+    
+    # Removals run as one alternation, so the email pattern claims the whole
+    # token before the mention pattern can trim it
+    assert cleaner.clean_text("cc:@bob hi", remove_mentions=True) == "hi"
+    assert cleaner.clean_text("x@y#tag", remove_mentions=True) == ""
+    
+    # Without email removal only the mention goes
+    assert cleaner.clean_text("cc:@bob hi", remove_mentions=True, remove_emails=False) == "cc: hi"
+
+def test_extract_entities_emojis():
+    cleaner = TextCleaner()
+    
+    assert cleaner.extract_entities("Hello 👋 World! 🌍 ©")['emojis'] == ["👋", "🌍", "©"]
+    assert cleaner.extract_entities("plain ascii text")['emojis'] == []
+
+def test_normalize_hashtags():
+    cleaner = TextCleaner()
+    hashtags = ["#MachineLearning", "#AI", "NLPResearch2024"]
+    expected = ["machine learning", "ai", "nlp research 2024"]
+    
+    assert cleaner.normalize_hashtags(hashtags) == expected
+    assert cleaner.normalize_hashtag_series(pd.Series(hashtags)).tolist() == expected
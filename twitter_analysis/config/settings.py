@@ -6,7 +6,7 @@ class Settings:
     """Configuration settings for the Twitter archive preprocessor."""
     
     DEFAULT_CONFIG: Dict[str, Any] = {
-        'output_formats': ['parquet', 'csv'],
+        'output_formats': ['parquet'],
         'logging_level': 'INFO',
         'batch_size': 1000,
         'max_workers': 4,
@@ -1,15 +1,28 @@
+import html
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Union
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import logging
 from pathlib import Path
-import re
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from operator import itemgetter
+from types import MappingProxyType
 from tqdm import tqdm
 
+from ..config.settings import Settings
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional at runtime; stdlib json accepts bytes too
+    from json import loads as json_loads
+
 @dataclass
 class TweetMedia:
     type: str
@@ -31,12 +44,284 @@ class Tweet:
     in_reply_to_user_id: Optional[str]
     lang: str
 
+# Arrow schema for processed tweets, in Tweet field order
+TWEET_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('text', pa.string()),
+    ('created_at', pa.timestamp('us', tz='UTC')),
+    ('likes', pa.int64()),
+    ('retweets', pa.int64()),
+    ('hashtags', pa.list_(pa.string())),
+    ('urls', pa.list_(pa.string())),
+    ('media', pa.list_(pa.struct([
+        ('type', pa.string()),
+        ('url', pa.string()),
+        ('local_path', pa.string()),
+    ]))),
+    ('is_retweet', pa.bool_()),
+    ('conversation_id', pa.string()),
+    ('in_reply_to_user_id', pa.string()),
+    ('lang', pa.string()),
+])
+
+TWITTER_DATE_FORMAT = '%a %b %d %H:%M:%S %z %Y'
+
+# Schema of per-file cached rows: as extracted, before date parsing and media resolution
+RAW_TWEET_SCHEMA = TWEET_SCHEMA.set(
+    TWEET_SCHEMA.get_field_index('created_at'), pa.field('created_at', pa.string())
+)
+
+# Bump when _extract_tweet changes so stale per-file caches are ignored
+CACHE_VERSION = 3
+
+# Rows buffered (checked after each file) before being converted to an Arrow batch;
+# also the row group size of the Parquet output
+PARQUET_BATCH_SIZE = 50_000
+
+DAY_NAMES = pa.array(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+def _init_worker_logging(log_file: str, level: int) -> None:
+    """Configure logging in a pool worker like setup_logging does in the parent.
+    
+    Under the spawn and forkserver start methods workers begin with no handlers,
+    so errors logged while extracting would never reach preprocessing.log. Under
+    fork the inherited handlers are kept and basicConfig does nothing.
+    """
+    logging.basicConfig(
+        level=level,
+        format=LOG_FORMAT,
+        handlers=[logging.FileHandler(log_file), logging.StreamHandler()]
+    )
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+_WEEKDAYS = frozenset(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
+_TIMEZONES = {'+0000': timezone.utc}
+
+def _parse_twitter_dt(date_str: str) -> datetime:
+    """Parse a Twitter timestamp such as 'Wed Oct 10 20:19:24 +0000 2018'.
+    
+    Slices the fixed-width fields directly, which is much faster than strptime.
+    The separators, weekday, offset sign and digit fields are checked first, and
+    anything that does not fit the layout falls back to strptime, raising
+    ValueError on invalid input.
+    """
+    try:
+        offset = date_str[20:25]
+        if not (
+            len(date_str) == 30
+            and date_str[3] == date_str[7] == date_str[10] == date_str[19] == date_str[25] == ' '
+            and date_str[13] == date_str[16] == ':'
+            and date_str[:3] in _WEEKDAYS
+            and offset[0] in '+-'
+            and (date_str[8:10] + date_str[11:13] + date_str[14:16] + date_str[17:19]
+                 + offset[1:] + date_str[26:30]).isdigit()
+        ):
+            raise ValueError
+        month = _MONTHS[date_str[4:7]]
+        tz = _TIMEZONES.get(offset)
+        if tz is None:
+            minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+            tz = _TIMEZONES.setdefault(offset, timezone(timedelta(minutes=-minutes if offset[0] == '-' else minutes)))
+        return datetime(
+            int(date_str[26:30]), month, int(date_str[8:10]),
+            int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+            tzinfo=tz,
+        )
+    except (KeyError, ValueError):
+        return datetime.strptime(date_str, TWITTER_DATE_FORMAT)
+
+def _clean_text(text: str) -> str:
+    """Clean tweet text by handling HTML entities and normalizing whitespace."""
+    # html.unescape returns at once when there is no '&' in the text
+    return ' '.join(html.unescape(text).split())
+
+# Shared read-only fallback for missing entity dicts, and entity field getters
+_EMPTY = MappingProxyType({})
+_get_text = itemgetter('text')
+_get_expanded_url = itemgetter('expanded_url')
+
+def _extract_tweet(tweet_data: Dict, interned: Optional[Dict[str, str]] = None) -> Optional[tuple]:
+    """Extract a tweet's fields as a row tuple in TWEET_SCHEMA column order.
+    
+    This is the hot path used by process_archive. It is module-level (and free
+    of instance state) so it can be pickled to worker processes, and skips the
+    Tweet dataclass layer: created_at is kept as the raw Twitter string for bulk
+    parsing, and media items are plain dicts whose local_path is resolved later.
+    
+    interned, when given, holds canonical copies of low-cardinality strings
+    (languages, media types, hashtags) shared across the caller's tweets, so
+    repeats are one object and pickle sends each once per worker result.
+    """
+    table = interned if interned is not None else {}
+
+    def intern(value: str) -> str:
+        return table.setdefault(value, value)
+
+    try:
+        tweet = tweet_data.get('tweet', tweet_data)
+        tweet_id = tweet.get('id_str', 'unknown')
+
+        created_at = tweet.get('created_at')
+        if not created_at:
+            raise ValueError("missing created_at")
+
+        # Extract media information
+        entities = tweet.get('entities') or _EMPTY
+        extended_entities = tweet.get('extended_entities') or _EMPTY
+
+        # Combine media from both sources
+        media_items = chain(entities.get('media', ()), extended_entities.get('media', ()))
+        media_list = [
+            {
+                'type': intern(media.get('type', 'unknown')),
+                'url': media.get('media_url', '') or media.get('media_url_https', ''),
+                'local_path': None,
+            }
+            for media in media_items
+        ]
+
+        # Ensure numeric values
+        likes = int(tweet.get('favorite_count', 0) or 0)
+        retweets = int(tweet.get('retweet_count', 0) or 0)
+
+        return (
+            tweet_id,
+            _clean_text(tweet.get('full_text', tweet.get('text', ''))),
+            created_at,
+            likes,
+            retweets,
+            list(map(intern, map(_get_text, entities.get('hashtags', ())))),
+            list(map(_get_expanded_url, entities.get('urls', ()))),
+            media_list,
+            'retweeted_status' in tweet,
+            tweet.get('conversation_id_str', ''),
+            tweet.get('in_reply_to_user_id_str'),
+            intern(tweet.get('lang', 'unknown')),
+        )
+    except Exception as e:
+        logger.error(f"Error processing tweet {tweet_id}: {e}")
+        return None
+
+def _load_json(file_path) -> Union[List, Dict]:
+    """Read and parse a JSON file, stripping Twitter's window.YTD JavaScript wrapper."""
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    if content.startswith(b'window.YTD.'):
+        content = content[content.index(b'['):]
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json_loads(content)
+
+def _extract_file(file_path: str) -> Optional[Dict[str, list]]:
+    """Load an archive file and extract its tweets into RAW_TWEET_SCHEMA columns.
+    
+    Runs in a worker process, so only the compact extracted columns are sent
+    back to the parent rather than every raw tweet dict. Returns None if the
+    file cannot be read or parsed, so the failure is not cached as empty.
+    """
+    columns: Dict[str, list] = {name: [] for name in RAW_TWEET_SCHEMA.names}
+    try:
+        tweets = _load_json(file_path)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON from {file_path}: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Error reading file {file_path}: {e}")
+        return None
+    if not isinstance(tweets, list):
+        return columns
+    
+    appenders = [columns[name].append for name in RAW_TWEET_SCHEMA.names]
+    # Intern table scoped to this file, so it is freed with the result
+    interned: Dict[str, str] = {}
+    for row in (_extract_tweet(tweet, interned) for tweet in tweets):
+        if row:
+            for append, value in zip(appenders, row):
+                append(value)
+    return columns
+
+def _process_tweet(tweet_data: Dict) -> Optional[Tweet]:
+    """Process a single tweet into a structured Tweet object.
+    
+    Local media paths are left unresolved; see resolve_local_media.
+    """
+    row = _extract_tweet(tweet_data)
+    if row is None:
+        return None
+    tweet = Tweet(*row)
+    tweet.media = [TweetMedia(**m) for m in tweet.media]
+    try:
+        tweet.created_at = _parse_twitter_dt(tweet.created_at)
+    except ValueError as e:
+        logger.error(f"Error processing tweet {tweet.id}: {e}")
+        return None
+    return tweet
+
+# pandas dtypes applied to the DataFrame returned by process_archive
+DATAFRAME_DTYPES = {
+    'id': 'string[pyarrow]',
+    'text': 'string[pyarrow]',
+    'lang': 'category',
+    # Ordered Monday..Sunday so sorting and groupby follow the week, not the alphabet
+    'day_of_week': pd.CategoricalDtype(DAY_NAMES.to_pylist(), ordered=True),
+    'hour_of_day': 'int8',
+    'likes': 'int32',
+    'retweets': 'int32',
+    'tweet_length': 'int16',
+    'has_media': 'bool',
+    'is_retweet': 'bool',
+}
+
+# Columns read by generate_summary_stats
+SUMMARY_COLUMNS = [
+    'created_at', 'likes', 'retweets', 'has_media', 'urls', 'hashtags',
+    'tweet_length', 'hour_of_day', 'day_of_week',
+]
+
+# Explicit types for converting a DataFrame, so empty object columns such as
+# urls/hashtags are not inferred as null
+SUMMARY_SCHEMA = pa.schema(
+    [TWEET_SCHEMA.field(name) for name in ('created_at', 'likes', 'retweets')]
+    + [pa.field('has_media', pa.bool_())]
+    + [TWEET_SCHEMA.field(name) for name in ('urls', 'hashtags')]
+    + [
+        pa.field('tweet_length', pa.int32()),
+        pa.field('hour_of_day', pa.int64()),
+        pa.field('day_of_week', pa.string()),
+    ]
+)
+
+def _mean(values) -> float:
+    """Mean of an Arrow array, NaN when empty."""
+    mean = pc.mean(values).as_py()
+    return float('nan') if mean is None else float(mean)
+
+def _top_counts(values, n: Optional[int] = None) -> Dict:
+    """Count distinct values of an Arrow array, most common first, ties by value."""
+    counts = pc.value_counts(values)
+    counts = pa.table({'values': counts.field('values'), 'counts': counts.field('counts')})
+    sort_keys = [('counts', 'descending'), ('values', 'ascending')]
+    if n is None:
+        order = pc.sort_indices(counts, sort_keys=sort_keys)
+    else:
+        # Partial selection of the top n, rather than sorting every distinct value;
+        # the value key makes the pick among tied counts deterministic
+        order = pc.select_k_unstable(counts, k=n, sort_keys=sort_keys)
+    counts = counts.take(order)
+    return dict(zip(counts['values'].to_pylist(), counts['counts'].to_pylist()))
+
 class TwitterArchivePreprocessor:
     def setup_logging(self):
         """Configure logging with timestamps and levels."""
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
+            format=LOG_FORMAT,
             handlers=[
                 logging.FileHandler(self.output_path / 'preprocessing.log'),
                 logging.StreamHandler()
@@ -44,35 +329,37 @@ class TwitterArchivePreprocessor:
         )
         self.logger = logging.getLogger(__name__)
 
-    def __init__(self, archive_path: str, output_path: str, save_formats: List[str] = None):
+    def __init__(self, archive_path: str, output_path: str, save_formats: List[str] = None,
+                 use_cache: bool = True):
         """Initialize the preprocessor with paths and setup logging.
         
         Args:
             archive_path (str): Path to the Twitter archive directory
             output_path (str): Path where processed files will be saved
             save_formats (List[str], optional): List of formats to save data in. 
-            Supported formats: 'parquet', 'csv', 'json'. Defaults to ['parquet', 'csv'].
+            Supported formats: 'parquet', 'feather', 'csv', 'json'. Defaults to ['parquet'];
+            CSV is opt-in since it is much larger and slower to write than Parquet.
+            use_cache (bool, optional): Reuse extracted tweets of unchanged archive
+            files from a Parquet cache under output_path/.cache. Defaults to True.
         """
         self.archive_path = Path(archive_path)
         self.output_path = Path(output_path)
         self.data_path = self.archive_path / "data"
         self.assets_path = self.archive_path / "assets"
-        self.save_formats = save_formats or ['parquet', 'csv']
+        self.save_formats = save_formats or ['parquet']
+        self.use_cache = use_cache
+        self.cache_path = self.output_path / ".cache"
+        self.settings = Settings()
+        self._media_index = self.build_media_index()
         self.output_path.mkdir(parents=True, exist_ok=True) # Create output directory if it doesn't exist
         self.setup_logging()   
 
     def load_json_file(self, file_path: Path) -> Dict:
         """Load and parse a JSON file, handling Twitter's JS format."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Remove JavaScript wrapper if present
-                if content.startswith('window.YTD.'):
-                    content = content[content.index('['):]
-                # Parse JSON
-                data = json.loads(content)
-                self.logger.debug(f"Successfully loaded {file_path}")
-                return data
+            data = _load_json(file_path)
+            self.logger.debug(f"Successfully loaded {file_path}")
+            return data
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse JSON from {file_path}: {e}")
             return {}
@@ -82,144 +369,250 @@ class TwitterArchivePreprocessor:
 
     def parse_datetime(self, date_str: str) -> datetime:
         """Parse Twitter's datetime format."""
-        return datetime.strptime(date_str, '%a %b %d %H:%M:%S %z %Y')
+        return _parse_twitter_dt(date_str)
 
     def clean_text(self, text: str) -> str:
         """Clean tweet text by handling HTML entities and normalizing whitespace."""
-        # Handle common HTML entities
-        text = re.sub(r'&amp;', '&', text)
-        text = re.sub(r'&lt;', '<', text)
-        text = re.sub(r'&gt;', '>', text)
-        # Normalize whitespace
-        text = ' '.join(text.split())
-        return text
+        return _clean_text(text)
 
     def process_tweet(self, tweet_data: Dict) -> Optional[Tweet]:
         """Process a single tweet into a structured Tweet object."""
-        try:
-            tweet = tweet_data.get('tweet', tweet_data)
-            tweet_id = tweet.get('id_str', 'unknown')
-            
-            # Handle date parsing with better error reporting
-            created_at = tweet.get('created_at', '')
-            try:
-                parsed_date = datetime.strptime(created_at, '%a %b %d %H:%M:%S %z %Y') if created_at else datetime.now(pytz.UTC)
-            except ValueError:
-                self.logger.debug(f"Tweet {tweet_id}: Invalid date format '{created_at}', using current time")
-                parsed_date = datetime.now(pytz.UTC)
-                
-            # Extract media information
-            media_list = []
-            entities = tweet.get('entities', {})
-            extended_entities = tweet.get('extended_entities', {})
-            
-            # Combine media from both sources
-            media_items = entities.get('media', []) + extended_entities.get('media', [])
-            for media in media_items:
-                media_type = media.get('type', 'unknown')
-                media_url = media.get('media_url', '') or media.get('media_url_https', '')
-                
-                media_list.append(TweetMedia(
-                    type=media_type,
-                    url=media_url,
-                    local_path=self.find_local_media(media_url)
-                ))
-
-            # Ensure numeric values
-            likes = int(tweet.get('favorite_count', 0) or 0)
-            retweets = int(tweet.get('retweet_count', 0) or 0)
-
-            return Tweet(
-                id=tweet_id,
-                text=self.clean_text(tweet.get('full_text', tweet.get('text', ''))),
-                created_at=parsed_date,
-                likes=likes,
-                retweets=retweets,
-                hashtags=[h.get('text', '') for h in entities.get('hashtags', [])],
-                urls=[u.get('expanded_url', '') for u in entities.get('urls', [])],
-                media=media_list,
-                is_retweet=bool(tweet.get('retweeted_status')),
-                conversation_id=tweet.get('conversation_id_str', ''),
-                in_reply_to_user_id=tweet.get('in_reply_to_user_id_str'),
-                lang=tweet.get('lang', 'unknown')
-            )
-        except Exception as e:
-            self.logger.error(f"Error processing tweet {tweet_id}: {e}")
-            return None
+        tweet = _process_tweet(tweet_data)
+        return self.resolve_local_media(tweet) if tweet else None
+
+    def resolve_local_media(self, tweet: Tweet) -> Tweet:
+        """Fill in local_path for each of a tweet's media items."""
+        for media in tweet.media:
+            media.local_path = self.find_local_media(media.url)
+        return tweet
+
+    def build_media_index(self) -> Dict[str, str]:
+        """Index asset filenames to paths with one directory scan per location.
+        
+        Locations are scanned in lookup priority order, so a filename present in
+        several of them resolves to the first, as the per-file probing used to.
+        """
+        index: Dict[str, str] = {}
+        for directory in (self.assets_path, self.assets_path / "media", self.assets_path / "images"):
+            if not directory.is_dir():
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        index.setdefault(entry.name, entry.path)
+        return index
 
     def find_local_media(self, media_url: str) -> Optional[str]:
         """Find corresponding local media file in assets directory."""
         if not media_url:
             return None
-            
-        # Extract filename from URL
-        filename = media_url.split('/')[-1]
+        # Look up filename from URL in the index built at initialization
+        return self._media_index.get(media_url.rsplit('/', 1)[-1])
+
+    def tweets_to_table(self, tweets: List[Tweet]) -> pa.Table:
+        """Build an Arrow table from Tweet objects; see columns_to_table."""
+        columns = {name: [getattr(tweet, name) for tweet in tweets] for name in TWEET_SCHEMA.names}
+        columns['media'] = [[asdict(m) for m in media] for media in columns['media']]
+        return self.columns_to_table(columns).sort_by('created_at')
+
+    def columns_to_table(self, columns: Dict[str, list]) -> pa.Table:
+        """Build an Arrow table of processed tweets with derived features, in input order.
         
-        # Check different possible locations
-        possible_paths = [
-            self.assets_path / filename,
-            self.assets_path / "media" / filename,
-            self.assets_path / "images" / filename
-        ]
+        columns maps each TWEET_SCHEMA name to a list of values. created_at may hold
+        datetimes or raw Twitter date strings; both are parsed in one vectorized
+        pass, and tweets whose date cannot be parsed are dropped.
+        """
+        # Pinned format with exact=True stays on pandas' C parser; cache=True
+        # memoizes repeated timestamp strings
+        created_at = pd.to_datetime(
+            columns['created_at'], format=TWITTER_DATE_FORMAT, exact=True, utc=True, cache=True, errors='coerce'
+        )
+        invalid = created_at.isna()
+        if invalid.any():
+            invalid_ids = [tweet_id for tweet_id, bad in zip(columns['id'], invalid) if bad]
+            self.logger.warning(
+                f"Dropping {len(invalid_ids)} tweets with unparseable dates, e.g. {invalid_ids[:5]}"
+            )
+        table = pa.table({**columns, 'created_at': created_at}, schema=TWEET_SCHEMA)
+        if invalid.any():
+            table = table.filter(pc.is_valid(table['created_at']))
         
-        for path in possible_paths:
-            if path.exists():
-                return str(path)
-        return None
+        # Add derived features with Arrow compute kernels
+        created_at = table['created_at']
+        table = table.append_column('has_media', pc.greater(pc.list_value_length(table['media']), 0))
+        table = table.append_column('tweet_length', pc.utf8_length(table['text']))
+        table = table.append_column('hour_of_day', pc.hour(created_at))
+        table = table.append_column('day_of_week', DAY_NAMES.take(pc.day_of_week(created_at)))
+        
+        return table
+
+    def cached_rows_path(self, file_path: Path) -> Path:
+        """Path of the row cache for an archive file, keyed on its size and mtime."""
+        stat = file_path.stat()
+        return self.cache_path / f"{file_path.stem}_v{CACHE_VERSION}_{stat.st_size}_{stat.st_mtime_ns}.parquet"
+
+    def load_cached_rows(self, file_path: Path) -> Optional[Dict[str, list]]:
+        """Return an archive file's cached RAW_TWEET_SCHEMA columns, or None if not cached."""
+        if not self.use_cache:
+            return None
+        cache_file = self.cached_rows_path(file_path)
+        if not cache_file.exists():
+            return None
+        try:
+            columns = pq.read_table(cache_file).to_pydict()
+            self.logger.debug(f"Loaded {file_path} from cache {cache_file}")
+            return columns
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache {cache_file}: {e}")
+            return None
+
+    def save_cached_rows(self, file_path: Path, columns: Dict[str, list]) -> None:
+        """Cache an archive file's extracted columns, replacing stale entries for the file."""
+        if not self.use_cache:
+            return
+        cache_file = self.cached_rows_path(file_path)
+        try:
+            self.cache_path.mkdir(exist_ok=True)
+            for stale in self.cache_path.glob(f"{file_path.stem}_v*.parquet"):
+                stale.unlink()
+            pq.write_table(pa.table(columns, schema=RAW_TWEET_SCHEMA), cache_file, compression='zstd')
+        except Exception as e:
+            self.logger.warning(f"Could not write cache {cache_file}: {e}")
+
+    def save_parquet(self, table: pa.Table) -> None:
+        """Write the processed tweets to tweets_processed.parquet, replacing it atomically.
+        
+        The table is written to a temporary file first, so a failed write leaves any
+        previous output in place rather than a truncated file.
+        """
+        parquet_path = self.output_path / 'tweets_processed.parquet'
+        tmp_path = parquet_path.with_name(parquet_path.name + '.tmp')
+        try:
+            pq.write_table(
+                table,
+                tmp_path,
+                row_group_size=PARQUET_BATCH_SIZE,
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=['lang', 'day_of_week'],
+            )
+            os.replace(tmp_path, parquet_path)
+            self.logger.info(f"Saved Parquet file to {parquet_path}")
+        except Exception as e:
+            self.logger.error(f"Error saving to parquet format: {e}")
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     def process_archive(self) -> pd.DataFrame:
         """Process the entire Twitter archive."""
         self.logger.info("Starting Twitter archive processing")
         
-        tweets_data = []
+        # Columnar buffers, one list per TWEET_SCHEMA column
+        columns: Dict[str, list] = {name: [] for name in TWEET_SCHEMA.names}
         
-        # Process all JSON files in parallel
-        json_files = list(self.data_path.glob('*.js'))
+        # Process all JSON files in parallel, in a stable order
+        json_files = sorted(self.data_path.glob('*.js'))
         self.logger.info(f"Found {len(json_files)} JSON files")
         
-        # Debug: Print the first tweet data
-        if json_files:
+        # Debug: Print the first tweet data (skipped entirely, file read included, unless debugging)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug and json_files:
             first_file_content = self.load_json_file(json_files[0])
-            self.logger.info(f"First file content structure: {type(first_file_content)}")
-            if first_file_content:
-                self.logger.info(f"First tweet structure: {first_file_content[0] if isinstance(first_file_content, list) else first_file_content}")
+            if isinstance(first_file_content, list) and first_file_content:
+                self.logger.debug("First tweet structure: %r", first_file_content[0])
         
-        with ThreadPoolExecutor() as executor:
-            for file_path in tqdm(json_files, desc="Processing files"):
-                tweet_list = self.load_json_file(file_path)
-                if tweet_list:
-                    futures = [executor.submit(self.process_tweet, tweet) for tweet in tweet_list]
-                    for future in futures:
-                        tweet = future.result()
-                        if tweet:
-                            tweets_data.append(tweet)
+        # Rows are converted to compact Arrow batches every PARQUET_BATCH_SIZE tweets, so
+        # the Python buffers hold at most one batch plus the files still in flight
+        batches: List[pa.Table] = []
+        
+        def flush_batch():
+            """Convert buffered rows to an Arrow batch."""
+            # Resolve local media in the parent, where the assets directory is known
+            find_local_media = self.find_local_media
+            for media_list in columns['media']:
+                for media in media_list:
+                    media['local_path'] = find_local_media(media['url'])
+            
+            # Debug: Print structure of processed tweets
+            if debug and not batches and columns['id']:
+                first_row = {name: values[0] for name, values in columns.items()}
+                self.logger.debug("First processed tweet structure: %r", first_row)
+            
+            batches.append(self.columns_to_table(columns))
+            for values in columns.values():
+                values.clear()
+        
+        def add_file_rows(file_columns: Dict[str, list]):
+            for name, values in file_columns.items():
+                columns[name].extend(values)
+            if len(columns['id']) >= PARQUET_BATCH_SIZE:
+                flush_batch()
         
-        # Debug: Print structure of processed tweets
-        if tweets_data:
-            self.logger.info(f"First processed tweet structure: {vars(tweets_data[0])}")
+        pending = iter([
+            file_path for file_path in json_files
+            if not (self.use_cache and self.cached_rows_path(file_path).exists())
+        ])
         
-        # Convert to DataFrame
-        df = pd.DataFrame([vars(tweet) for tweet in tweets_data])
+        # Parsing and extraction are CPU-bound, so each worker process handles whole
+        # files. Results are consumed in file order, which keeps the output
+        # deterministic, with at most max_workers files submitted ahead so finished
+        # results cannot pile up behind a slow file.
+        with ProcessPoolExecutor(
+            max_workers=self.settings.max_workers,
+            initializer=_init_worker_logging,
+            initargs=(str(self.output_path / 'preprocessing.log'), self.logger.getEffectiveLevel()),
+        ) as executor:
+            futures = {}
+            
+            def submit_next():
+                file_path = next(pending, None)
+                if file_path is not None:
+                    futures[file_path] = executor.submit(_extract_file, str(file_path))
+            
+            for _ in range(self.settings.max_workers):
+                submit_next()
+            for file_path in tqdm(json_files, desc="Processing files"):
+                future = futures.pop(file_path, None)
+                if future is not None:
+                    submit_next()
+                file_columns = None if future else self.load_cached_rows(file_path)
+                if file_columns is None:
+                    # Not cached, or the cache entry turned out to be unreadable
+                    future = future or executor.submit(_extract_file, str(file_path))
+                    file_columns = future.result()
+                    if file_columns is None:
+                        continue  # Read or parse failed; left uncached so the next run retries
+                    self.save_cached_rows(file_path, file_columns)
+                add_file_rows(file_columns)
+        if columns['id'] or not batches:
+            flush_batch()
         
-        # Debug: Print DataFrame columns
-        self.logger.info(f"DataFrame columns: {df.columns.tolist()}")
+        # Sort by timestamp one column at a time: concat_tables is zero-copy, and each
+        # unsorted column is released as soon as its sorted copy exists, so the peak
+        # is the table plus one column rather than two full tables
+        table = pa.concat_tables(batches)
+        batches.clear()
+        order = pc.sort_indices(table['created_at'])
+        schema, arrays = table.schema, table.columns
+        del table
+        for i in range(len(arrays)):
+            arrays[i] = arrays[i].take(order)
+        table = pa.Table.from_arrays(arrays, schema=schema)
+        del arrays
         
-        # Convert media objects to serializable format
-        if 'media' in df.columns:
-            df['media'] = df['media'].apply(lambda x: [{'type': m.type, 'url': m.url, 'local_path': m.local_path} for m in x])
-            self.logger.info("Successfully converted media objects to serializable format")
-        else:
-            self.logger.warning("No 'media' column found in DataFrame")
+        if 'parquet' in (f.lower() for f in self.save_formats):
+            self.save_parquet(table)
         
         try:
-            # Add derived features
-            df['has_media'] = df['media'].apply(lambda x: len(x) > 0) if 'media' in df.columns else False
-            df['tweet_length'] = df['text'].str.len()
-            df['hour_of_day'] = df['created_at'].dt.hour
-            df['day_of_week'] = df['created_at'].dt.day_name()
+            # Convert to DataFrame once, releasing Arrow buffers as columns are converted
+            df = table.to_pandas(self_destruct=True)
+            del table
             
-            # Sort by timestamp
-            df.sort_values('created_at', inplace=True)
+            # Compact dtypes: Arrow-backed strings, categoricals for low-cardinality columns
+            df = df.astype(DATAFRAME_DTYPES)
+            
+            # Debug: Print DataFrame columns
+            self.logger.debug("DataFrame columns: %s", df.columns.tolist())
             
             # Save in specified formats
             for format_type in self.save_formats:
@@ -228,11 +621,10 @@ class TwitterArchivePreprocessor:
                         df.to_csv(self.output_path / 'tweets_processed.csv', index=False)
                         self.logger.info(f"Saved CSV file to {self.output_path / 'tweets_processed.csv'}")
                     elif format_type.lower() == 'parquet':
-                        # Create a copy of the DataFrame with serializable types
-                        df_parquet = df.copy()
-                        df_parquet['media'] = df_parquet['media'].apply(json.dumps) if 'media' in df_parquet.columns else '[]'
-                        df_parquet.to_parquet(self.output_path / 'tweets_processed.parquet')
-                        self.logger.info(f"Saved Parquet file to {self.output_path / 'tweets_processed.parquet'}")
+                        pass  # Written from the sorted Arrow table by save_parquet
+                    elif format_type.lower() == 'feather':
+                        df.to_feather(self.output_path / 'tweets_processed.feather', compression='zstd')
+                        self.logger.info(f"Saved Feather file to {self.output_path / 'tweets_processed.feather'}")
                     elif format_type.lower() == 'json':
                         df.to_json(self.output_path / 'tweets_processed.json', orient='records', date_format='iso')
                         self.logger.info(f"Saved JSON file to {self.output_path / 'tweets_processed.json'}")
@@ -247,29 +639,43 @@ class TwitterArchivePreprocessor:
         self.logger.info(f"Processing complete. Processed {len(df)} tweets.")
         return df
 
-    def generate_summary_stats(self, df: pd.DataFrame) -> Dict:
-        """Generate summary statistics for the processed tweets."""
+    def generate_summary_stats(self, df: Union[pd.DataFrame, pa.Table, None] = None) -> Dict:
+        """Generate summary statistics for the processed tweets.
+        
+        Accepts the DataFrame returned by process_archive or an Arrow table. If
+        neither is given, only the needed columns are read back from
+        tweets_processed.parquet. All statistics are computed with Arrow kernels.
+        """
+        if df is None:
+            table = pq.read_table(self.output_path / 'tweets_processed.parquet', columns=SUMMARY_COLUMNS)
+        elif isinstance(df, pd.DataFrame):
+            table = pa.Table.from_pandas(df, schema=SUMMARY_SCHEMA, preserve_index=False)
+        else:
+            table = df.select(SUMMARY_COLUMNS)
+        table = table.combine_chunks()
+        date_range = pc.min_max(table['created_at']).as_py()
+        
         stats = {
-            'total_tweets': int(len(df)),
+            'total_tweets': table.num_rows,
             'date_range': {
-                'start': df['created_at'].min(),
-                'end': df['created_at'].max()
+                'start': date_range['min'],
+                'end': date_range['max']
             },
             'engagement': {
-                'total_likes': int(df['likes'].sum()),
-                'total_retweets': int(df['retweets'].sum()),
-                'avg_likes_per_tweet': float(df['likes'].mean()),
-                'avg_retweets_per_tweet': float(df['retweets'].mean())
+                'total_likes': pc.sum(table['likes'], min_count=0).as_py(),
+                'total_retweets': pc.sum(table['retweets'], min_count=0).as_py(),
+                'avg_likes_per_tweet': _mean(table['likes']),
+                'avg_retweets_per_tweet': _mean(table['retweets'])
             },
             'content_analysis': {
-                'tweets_with_media': int(df['has_media'].sum()),
-                'tweets_with_urls': int(df['urls'].apply(len).sum()),
-                'most_common_hashtags': dict(df['hashtags'].explode().value_counts().head(10)),
-                'avg_tweet_length': float(df['tweet_length'].mean())
+                'tweets_with_media': pc.sum(table['has_media'], min_count=0).as_py(),
+                'tweets_with_urls': pc.sum(pc.list_value_length(table['urls']), min_count=0).as_py(),
+                'most_common_hashtags': _top_counts(pc.list_flatten(table['hashtags']), 10),
+                'avg_tweet_length': _mean(table['tweet_length'])
             },
             'timing': {
-                'most_active_hours': dict(df['hour_of_day'].value_counts().head(5)),
-                'most_active_days': dict(df['day_of_week'].value_counts())
+                'most_active_hours': _top_counts(table['hour_of_day'], 5),
+                'most_active_days': _top_counts(table['day_of_week'])
             }
         }
         
@@ -0,0 +1,292 @@
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+import shutil
+import hashlib
+import logging
+import mimetypes
+import mmap
+from dataclasses import asdict, dataclass, fields
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from tqdm import tqdm
+import json
+
+try:
+    import blake3
+except ImportError:  # blake3 is optional; fall back to stdlib BLAKE2
+    blake3 = None
+
+@dataclass
+class MediaFile:
+    """Represents a media file from the Twitter archive"""
+    file_id: str
+    original_path: Path
+    media_type: str
+    tweet_ids: Set[str]
+    size_bytes: int
+    hash_fingerprint: Optional[str]
+    width: Optional[int] = None
+    height: Optional[int] = None
+    mtime_ns: Optional[int] = None
+
+def fingerprint_file(file_path: str, multithreaded: bool = False) -> str:
+    """
+    Calculate a content fingerprint of a file for duplicate detection.
+    
+    Uses BLAKE3 over a memory map (SIMD) when the blake3 package is installed,
+    otherwise BLAKE2b from hashlib. Takes a plain path string so it can be
+    dispatched to worker processes. multithreaded lets BLAKE3 use every core
+    on large files; leave it off inside a process pool, which already does.
+    """
+    if blake3 is not None:
+        max_threads = blake3.blake3.AUTO if multithreaded else 1
+        return blake3.blake3(max_threads=max_threads).update_mmap(file_path).hexdigest()
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.blake2b().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.blake2b(mm).hexdigest()
+
+class MediaHandler:
+    """Handles processing and organization of media files from Twitter archive"""
+    
+    def __init__(self, archive_path: str, output_path: str):
+        """
+        Initialize the MediaHandler.
+        
+        Args:
+            archive_path: Path to the Twitter archive
+            output_path: Path where processed media will be stored
+        """
+        self.archive_path = Path(archive_path)
+        self.output_path = Path(output_path)
+        self.media_path = self.archive_path / "data" / "media"
+        self.assets_path = self.archive_path / "assets"
+        self.logger = logging.getLogger(__name__)
+        
+        # Ensure output directories exist
+        self.processed_media_path = self.output_path / "processed_media"
+        self.processed_media_path.mkdir(parents=True, exist_ok=True)
+        
+        # Track processed files
+        self.media_inventory: Dict[str, MediaFile] = {}
+        self.inventory_path = self.output_path / "media_inventory.parquet"
+
+    def calculate_file_hash(self, file_path: Path) -> str:
+        """Calculate a content fingerprint of a file (see fingerprint_file)."""
+        return fingerprint_file(str(file_path), multithreaded=True)
+
+    def load_inventory(self) -> Dict[str, Tuple[int, int, str]]:
+        """
+        Load the inventory persisted by a previous run.
+        
+        Returns:
+            Dict mapping original file paths to (size_bytes, mtime_ns, hash_fingerprint)
+        """
+        if not self.inventory_path.exists():
+            return {}
+        try:
+            df = pd.read_parquet(self.inventory_path, columns=["original_path", "size_bytes", "mtime_ns", "hash_fingerprint"])
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable media inventory {self.inventory_path}: {e}")
+            return {}
+        return {
+            path: (size, mtime_ns, fingerprint)
+            for path, size, mtime_ns, fingerprint in df.itertuples(index=False)
+        }
+
+    def save_inventory(self) -> None:
+        """Persist the media inventory so unchanged files are not re-hashed next run."""
+        records = []
+        for media_file in self.media_inventory.values():
+            record = asdict(media_file)
+            record["original_path"] = str(media_file.original_path)
+            record["tweet_ids"] = sorted(media_file.tweet_ids)
+            records.append(record)
+        # Explicit columns so an empty inventory still has the ones load_inventory reads
+        columns = [field.name for field in fields(MediaFile)]
+        pd.DataFrame(records, columns=columns).to_parquet(self.inventory_path, index=False)
+
+    def detect_media_type(self, file_path: Path) -> str:
+        """Detect the media type of a file."""
+        mime_type, _ = mimetypes.guess_type(str(file_path))
+        if mime_type:
+            return mime_type
+        # Fallback to basic extension check
+        return f"application/{file_path.suffix[1:]}" if file_path.suffix else "application/octet-stream"
+
+    def process_media_file(self, file_path: Path, tweet_id: str,
+                           file_hash: Optional[str] = None, hash_file: bool = True,
+                           stat: Optional[os.stat_result] = None) -> Optional[MediaFile]:
+        """
+        Process a single media file.
+        
+        Args:
+            file_path: Path to the media file
+            tweet_id: ID of the tweet the file belongs to
+            file_hash: Precomputed fingerprint, if already known
+            hash_file: Whether to fingerprint the file when file_hash is not given
+            stat: The file's stat result, if already known from a directory scan
+        """
+        try:
+            if stat is None:
+                try:
+                    stat = file_path.stat()
+                except FileNotFoundError:
+                    self.logger.warning(f"Media file not found: {file_path}")
+                    return None
+
+            file_id = file_path.stem
+            if file_hash is None and hash_file:
+                file_hash = self.calculate_file_hash(file_path)
+            
+            # Check if we've already processed this file
+            if file_id in self.media_inventory:
+                self.media_inventory[file_id].tweet_ids.add(tweet_id)
+                return self.media_inventory[file_id]
+
+            media_file = MediaFile(
+                file_id=file_id,
+                original_path=file_path,
+                media_type=self.detect_media_type(file_path),
+                tweet_ids={tweet_id},
+                size_bytes=stat.st_size,
+                hash_fingerprint=file_hash,
+                mtime_ns=stat.st_mtime_ns
+            )
+            
+            self.media_inventory[file_id] = media_file
+            return media_file
+
+        except Exception as e:
+            self.logger.error(f"Error processing media file {file_path}: {e}")
+            return None
+
+    def organize_media(self) -> Dict[str, List[str]]:
+        """
+        Organize media files into a structured format.
+        
+        Fingerprints are computed in a process pool, so scripts calling this must
+        do so under an ``if __name__ == "__main__":`` guard on platforms that
+        spawn workers (Windows, macOS, and POSIX from Python 3.14).
+        
+        Returns:
+            Dict mapping tweet IDs to lists of media file IDs
+        """
+        tweet_media_map: Dict[str, List[str]] = {}
+        
+        # Collect files with their stat results in a single directory scan
+        media_files: List[Path] = []
+        stats: Dict[Path, os.stat_result] = {}
+        if self.media_path.is_dir():
+            with os.scandir(self.media_path) as entries:
+                for entry in entries:
+                    if entry.is_file() and "." in entry.name:
+                        file_path = Path(entry.path)
+                        media_files.append(file_path)
+                        stats[file_path] = entry.stat()
+        
+        # Only files sharing a size with another file can be duplicates, so only those are hashed
+        size_groups: Dict[int, List[Path]] = {}
+        for file_path in media_files:
+            size_groups.setdefault(stats[file_path].st_size, []).append(file_path)
+        candidates = [p for group in size_groups.values() if len(group) > 1 for p in group]
+        
+        # Reuse fingerprints from the last run for files whose size and mtime are unchanged
+        previous = self.load_inventory()
+        hashes: Dict[Path, str] = {}
+        pending: List[Path] = []
+        for file_path in candidates:
+            stat = stats[file_path]
+            cached = previous.get(str(file_path))
+            if cached and cached[2] and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+                hashes[file_path] = cached[2]
+            else:
+                pending.append(file_path)
+        self.logger.info(
+            f"{len(candidates)} of {len(media_files)} media files share a size; "
+            f"reusing {len(hashes)} cached fingerprints, hashing {len(pending)}"
+        )
+        
+        # Hash new or changed files in worker processes, passing only path strings
+        if pending:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                digests = executor.map(fingerprint_file, [str(p) for p in pending])
+                for file_path, digest in zip(pending, tqdm(digests, total=len(pending), desc="Hashing media files")):
+                    hashes[file_path] = digest
+        
+        for file_path in tqdm(media_files, desc="Processing media files"):
+            # Extract tweet ID from media filename (assuming standard Twitter format)
+            tweet_id = file_path.stem.split("-")[0]
+            media_file = self.process_media_file(
+                file_path, tweet_id, hashes.get(file_path), hash_file=False, stat=stats[file_path]
+            )
+            if media_file:
+                for tweet_id in media_file.tweet_ids:
+                    if tweet_id not in tweet_media_map:
+                        tweet_media_map[tweet_id] = []
+                    tweet_media_map[tweet_id].append(media_file.file_id)
+        
+        self.save_inventory()
+        return tweet_media_map
+
+    def copy_to_processed(self, preserve_structure: bool = True) -> None:
+        """
+        Copy media files to processed directory with optional restructuring.
+        
+        Args:
+            preserve_structure: If True, maintains original directory structure
+        """
+        for file_id, media_file in tqdm(self.media_inventory.items(), desc="Copying media files"):
+            try:
+                source_path = media_file.original_path
+                if preserve_structure:
+                    # Organize by media type
+                    media_type_folder = media_file.media_type.split('/')[0]
+                    dest_path = self.processed_media_path / media_type_folder / source_path.name
+                else:
+                    dest_path = self.processed_media_path / source_path.name
+                
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source_path, dest_path)
+                
+            except Exception as e:
+                self.logger.error(f"Error copying media file {source_path}: {e}")
+
+    def generate_media_report(self) -> None:
+        """Generate a report of processed media files."""
+        report = {
+            "total_files": len(self.media_inventory),
+            "total_size_bytes": sum(m.size_bytes for m in self.media_inventory.values()),
+            "media_types": {},
+            "duplicate_files": []
+        }
+        
+        # Count media types
+        for media_file in self.media_inventory.values():
+            media_type = media_file.media_type
+            if media_type not in report["media_types"]:
+                report["media_types"][media_type] = 0
+            report["media_types"][media_type] += 1
+        
+        # Find duplicates by (size, hash); files with a unique size are never hashed
+        hash_map = {}
+        for media_file in self.media_inventory.values():
+            if media_file.hash_fingerprint is None:
+                continue
+            key = (media_file.size_bytes, media_file.hash_fingerprint)
+            if key in hash_map:
+                report["duplicate_files"].append({
+                    "original": hash_map[key],
+                    "duplicate": media_file.file_id
+                })
+            else:
+                hash_map[key] = media_file.file_id
+        
+        # Save report
+        report_path = self.output_path / "media_report.json"
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        
+        self.logger.info(f"Media report generated at {report_path}")
\ No newline at end of file
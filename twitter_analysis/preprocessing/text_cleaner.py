@@ -1,15 +1,44 @@
+import html
 import re
-from typing import Set, List
+from functools import lru_cache
+from typing import Set, List, Optional, Pattern
 import unicodedata
 import emoji
+import pandas as pd
+
+URL_REGEX = r'https?://\S+|www\.\S+'
+MENTION_REGEX = r'@\w+'
+HASHTAG_REGEX = r'#\w+'
+EMAIL_REGEX = r'\S+@\S+'
+NUMBER_REGEX = r'\d+'
+CAMEL_CASE_REGEX = r'[A-Z]?[a-z]+|[A-Z]{2,}(?=[A-Z][a-z]|\d|\W|$)|\d+'
+
+# Removal patterns in clean_text's option order
+_REMOVAL_REGEXES = (URL_REGEX, MENTION_REGEX, HASHTAG_REGEX, EMAIL_REGEX, NUMBER_REGEX)
+
+# Per-character membership only ever matches single code point entries
+_EMOJI_CHARS = frozenset(key for key in emoji.EMOJI_DATA if len(key) == 1)
+
+def _find_emojis(text: str) -> List[str]:
+    """Return the emoji characters in text, skipping the scan for all-ASCII text."""
+    if text.isascii():
+        return []
+    return [c for c in text if c in _EMOJI_CHARS]
+
+@lru_cache(maxsize=None)
+def _removal_pattern(enabled: tuple) -> Optional[Pattern]:
+    """Compile the enabled removal patterns into one alternation, so text is scanned once."""
+    regexes = [regex for regex, on in zip(_REMOVAL_REGEXES, enabled) if on]
+    return re.compile('|'.join(regexes)) if regexes else None
 
 class TextCleaner:
     def __init__(self):
-        self.url_pattern = re.compile(r'https?://\S+|www\.\S+')
-        self.mention_pattern = re.compile(r'@\w+')
-        self.hashtag_pattern = re.compile(r'#\w+')
-        self.email_pattern = re.compile(r'\S+@\S+')
-        self.number_pattern = re.compile(r'\d+')
+        self.url_pattern = re.compile(URL_REGEX)
+        self.mention_pattern = re.compile(MENTION_REGEX)
+        self.hashtag_pattern = re.compile(HASHTAG_REGEX)
+        self.email_pattern = re.compile(EMAIL_REGEX)
+        self.number_pattern = re.compile(NUMBER_REGEX)
+        self.camel_case_pattern = re.compile(CAMEL_CASE_REGEX)
         self.unicode_pattern = re.compile(r'[^\x00-\x7F]+')
         
     def clean_text(self, text: str, 
@@ -29,29 +58,20 @@ class TextCleaner:
         # Store emojis if needed
         emoji_list = []
         if preserve_emojis:
-            emoji_list = [c for c in text if c in emoji.EMOJI_DATA]
+            emoji_list = _find_emojis(text)
             
         # Basic cleaning
         text = text.strip()
         
         # Replace HTML entities
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        text = text.replace('&#39;', "'")
+        text = html.unescape(text)
         
-        # Apply removals based on parameters
-        if remove_urls:
-            text = self.url_pattern.sub(' ', text)
-        if remove_mentions:
-            text = self.mention_pattern.sub(' ', text)
-        if remove_hashtags:
-            text = self.hashtag_pattern.sub(' ', text)
-        if remove_emails:
-            text = self.email_pattern.sub(' ', text)
-        if remove_numbers:
-            text = self.number_pattern.sub(' ', text)
+        # Apply removals based on parameters in a single pass
+        removal_pattern = _removal_pattern(
+            (remove_urls, remove_mentions, remove_hashtags, remove_emails, remove_numbers)
+        )
+        if removal_pattern is not None:
+            text = removal_pattern.sub(' ', text)
             
         # Unicode normalization
         if normalize_unicode:
@@ -74,7 +94,7 @@ class TextCleaner:
             'urls': self.url_pattern.findall(text),
             'mentions': self.mention_pattern.findall(text),
             'hashtags': self.hashtag_pattern.findall(text),
-            'emojis': [c for c in text if c in emoji.EMOJI_DATA],
+            'emojis': _find_emojis(text),
             'emails': self.email_pattern.findall(text)
         }
 
@@ -82,11 +102,16 @@ class TextCleaner:
         """
         Normalize hashtags (e.g., #MachineLearning -> machine learning)
         """
-        def split_camel_case(tag: str) -> str:
-            # Remove # if present
-            tag = tag.lstrip('#')
-            # Split camel case
-            words = re.findall(r'[A-Z]?[a-z]+|[A-Z]{2,}(?=[A-Z][a-z]|\d|\W|$)|\d+', tag)
-            return ' '.join(word.lower() for word in words)
-            
-        return [split_camel_case(tag) for tag in hashtags]
\ No newline at end of file
+        return [
+            ' '.join(word.lower() for word in self.camel_case_pattern.findall(tag.lstrip('#')))
+            for tag in hashtags
+        ]
+
+    def normalize_hashtag_series(self, hashtags: pd.Series) -> pd.Series:
+        """
+        Normalize a Series of hashtags with vectorized string methods
+        """
+        return (hashtags.str.lstrip('#')
+                .str.findall(self.camel_case_pattern)
+                .str.join(' ')
+                .str.lower())